@@ -0,0 +1,30 @@
+from typing import Optional
+
+from fastapi import Query
+from nicegui import app
+from starlette.responses import Response
+
+from app.dashboard_service import get_dashboard_stats
+from app.database import get_session
+from app.models import TransferStatus
+from app.schemas_fast import msgspec_response, rows_response
+from app.transfer_service import FAST_LIST_COLUMNS, list_transfers, list_transfers_fast
+
+
+def create() -> None:
+    @app.get("/api/transfers")
+    def transfers(limit: int = Query(default=50, ge=1, le=500), offset: int = Query(default=0, ge=0)) -> Response:
+        with get_session() as session:
+            return msgspec_response(list_transfers(session, limit=limit, offset=offset))
+
+    @app.get("/api/transfers/compact")
+    def transfers_compact(
+        limit: int = Query(default=50, ge=1, le=1000), status: Optional[TransferStatus] = None
+    ) -> Response:
+        with get_session() as session:
+            return rows_response(FAST_LIST_COLUMNS, list_transfers_fast(session, limit=limit, status=status))
+
+    @app.get("/api/dashboard")
+    def dashboard(months: int = Query(default=6, ge=1, le=24)) -> Response:
+        with get_session() as session:
+            return msgspec_response(get_dashboard_stats(session, months=months))
@@ -0,0 +1,122 @@
+import io
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import orjson
+from sqlalchemy import event
+from sqlmodel import Session, desc, select
+
+from app.models import AuditLog
+
+# created_at is left to the column's server default
+_COPY_COLUMNS = ("user_id", "action", "table_name", "record_id", "old_values", "new_values", "ip_address", "user_agent")
+_COPY_SQL = f"COPY {AuditLog.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_field(value: Any) -> str:
+    """A value in COPY text format: NULL as \\N, with backslashes and row/column separators escaped."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bytes):
+        value = value.decode()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class AuditBuffer:
+    """Collects audit entries during a unit of work and writes them with a single COPY.
+
+    The buffered rows are copied on the session's connection right before it commits, so they land in the
+    same transaction as the changes they describe. Rows still buffered when the block exits normally are
+    copied into the open transaction; on an exception they are dropped.
+
+        with AuditBuffer(session) as audit:
+            ...
+            audit.add(user.id, "UPDATE", "students", student.id, old_values=old, new_values=new)
+            session.commit()
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "AuditBuffer":
+        event.listen(self.session, "before_commit", self._before_commit)
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Optional[TracebackType]
+    ) -> None:
+        event.remove(self.session, "before_commit", self._before_commit)
+        if exc_type is None:
+            self.flush()
+        else:
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        user_id: int,
+        action: str,
+        table_name: str,
+        record_id: Optional[int] = None,
+        old_values: Optional[Dict[str, Any]] = None,
+        new_values: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        self._rows.append(
+            (
+                user_id,
+                action,
+                table_name,
+                record_id,
+                orjson.dumps(old_values) if old_values is not None else None,
+                orjson.dumps(new_values) if new_values is not None else None,
+                ip_address,
+                user_agent,
+            )
+        )
+
+    def flush(self) -> int:
+        """COPY the buffered rows into audit_logs on the session's current transaction."""
+        if not self._rows:
+            return 0
+        # Pending ORM rows (e.g. a just-created user) must exist before the COPY references them
+        self.session.flush()
+        data = "".join("\t".join(_copy_field(value) for value in row) + "\n" for row in self._rows)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(_COPY_SQL, io.BytesIO(data.encode()))
+        finally:
+            cursor.close()
+        count = len(self._rows)
+        self._rows.clear()
+        return count
+
+    def _before_commit(self, session: Session) -> None:
+        self.flush()
+
+
+def find_audit_logs(
+    session: Session,
+    table_name: Optional[str] = None,
+    old_values: Optional[Dict[str, Any]] = None,
+    new_values: Optional[Dict[str, Any]] = None,
+    limit: int = 100,
+) -> List[AuditLog]:
+    """Audit entries whose old/new values contain the given key/value pairs, newest first.
+
+    Uses JSONB containment (`@>`) so the lookup is served by the GIN indexes instead of parsing every row.
+    """
+    statement = select(AuditLog)
+    if table_name is not None:
+        statement = statement.where(AuditLog.table_name == table_name)
+    if old_values is not None:
+        statement = statement.where(AuditLog.old_values.contains(orjson.dumps(old_values)))  # type: ignore[union-attr]
+    if new_values is not None:
+        statement = statement.where(AuditLog.new_values.contains(orjson.dumps(new_values)))  # type: ignore[union-attr]
+    statement = statement.order_by(desc(AuditLog.id)).limit(limit)
+    return list(session.exec(statement).all())
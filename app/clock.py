@@ -0,0 +1,45 @@
+"""One wall-clock reading per request.
+
+Python-side timestamps (transfer numbers, "today" for the dashboard) read `request_now()`, so every value
+derived during a request agrees and the clock is read once. Outside a request it falls back to the current time.
+Database timestamps don't need this: Postgres' now() is already fixed for the whole transaction.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Iterator, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_REQUEST_NOW: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def request_now() -> datetime:
+    now = _REQUEST_NOW.get()
+    return now if now is not None else datetime.now(UTC)
+
+
+@contextmanager
+def frozen_now(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Pin `request_now()` to one timestamp (the current time by default) for the duration of the block."""
+    now = now or datetime.now(UTC)
+    token = _REQUEST_NOW.set(now)
+    try:
+        yield now
+    finally:
+        _REQUEST_NOW.reset(token)
+
+
+class RequestClockMiddleware:
+    """Plain ASGI middleware: every request_now() call while handling a request returns the same timestamp."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with frozen_now():
+            await self.app(scope, receive, send)
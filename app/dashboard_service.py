@@ -0,0 +1,64 @@
+from datetime import UTC, date
+from typing import List, Optional, Tuple
+
+from sqlmodel import Session, func, select, tuple_
+
+from app.clock import request_now
+from app.models import TransferStatistics
+from app.schemas_fast import DashboardStatsRead
+
+
+def _recent_months(today: date, months: int) -> List[Tuple[int, int]]:
+    """(year, month) pairs for the last `months` months, oldest first, ending with the month of `today`."""
+    index = today.year * 12 + today.month - 1
+    return [((index - offset) // 12, (index - offset) % 12 + 1) for offset in reversed(range(months))]
+
+
+def get_dashboard_stats(session: Session, today: Optional[date] = None, months: int = 6) -> DashboardStatsRead:
+    """Dashboard counters read from the transfer_statistics rollup instead of aggregating transfers."""
+    # the rollup buckets transfers by UTC month, so 'today' is the UTC date too
+    today = today or request_now().astimezone(UTC).date()
+    recent = _recent_months(today, months)
+
+    totals = session.exec(
+        select(
+            func.coalesce(func.sum(TransferStatistics.total_incoming), 0),
+            func.coalesce(func.sum(TransferStatistics.total_outgoing), 0),
+            func.coalesce(func.sum(TransferStatistics.total_pending), 0),
+        )
+    ).one()
+    rows = {
+        (row.year, row.month): row
+        for row in session.exec(
+            select(TransferStatistics).where(
+                tuple_(TransferStatistics.year, TransferStatistics.month).in_(recent)  # type: ignore[arg-type]
+            )
+        )
+    }
+
+    trends = []
+    for year, month in recent:
+        row = rows.get((year, month))
+        trends.append(
+            {
+                "year": year,
+                "month": month,
+                "incoming": row.total_incoming if row is not None else 0,
+                "outgoing": row.total_outgoing if row is not None else 0,
+                "approved": row.total_approved if row is not None else 0,
+                "rejected": row.total_rejected if row is not None else 0,
+                "pending": row.total_pending if row is not None else 0,
+            }
+        )
+
+    total_incoming, total_outgoing, pending = totals
+    current = trends[-1]
+    return DashboardStatsRead(
+        total_transfers=total_incoming + total_outgoing,
+        total_incoming=total_incoming,
+        total_outgoing=total_outgoing,
+        pending_approvals=pending,
+        approved_this_month=current["approved"],
+        rejected_this_month=current["rejected"],
+        monthly_trends=trends,
+    )
@@ -0,0 +1,23 @@
+-- Converts an existing database to the column types declared in app/models_db.py:
+-- students.gender -> gender_t, student_transfers.priority_level -> priority_t, grades -> SMALLINT.
+-- Fresh databases created by create_tables() already have these types; run this once on older ones:
+--   psql "$APP_DATABASE_URL" -f app/migrations/001_native_enums_and_smallint_grades.sql
+
+BEGIN;
+
+CREATE TYPE gender_t AS ENUM ('Laki-laki', 'Perempuan');
+CREATE TYPE priority_t AS ENUM ('urgent', 'normal', 'low');
+
+ALTER TABLE students
+    ALTER COLUMN gender TYPE gender_t USING gender::gender_t,
+    ALTER COLUMN current_grade TYPE SMALLINT USING current_grade::smallint;
+
+-- ix_transfer_report INCLUDEs the grade columns; Postgres rebuilds it as part of the type change
+ALTER TABLE student_transfers
+    ALTER COLUMN priority_level DROP DEFAULT,
+    ALTER COLUMN priority_level TYPE priority_t USING priority_level::priority_t,
+    ALTER COLUMN priority_level SET DEFAULT 'normal',
+    ALTER COLUMN grade_from TYPE SMALLINT USING grade_from::smallint,
+    ALTER COLUMN grade_to TYPE SMALLINT USING grade_to::smallint;
+
+COMMIT;
@@ -0,0 +1,73 @@
+-- Converts the native enum columns of an existing database to the SMALLINT codes written by SmallIntEnum
+-- (app/models_db.py). The old types stored member names ('DRAFT'); a code is the member's declaration
+-- position in its Enum class, so the CASE lists below must follow that order.
+-- Fresh databases created by create_tables() already have these types; run this once on older ones:
+--   psql "$APP_DATABASE_URL" -f app/migrations/002_smallint_enum_codes.sql
+
+BEGIN;
+
+ALTER TABLE users
+    ALTER COLUMN role TYPE SMALLINT USING CASE role::text
+        WHEN 'SCHOOL_ADMIN' THEN 0
+        WHEN 'TEACHER' THEN 1
+        WHEN 'DISTRICT_OPERATOR' THEN 2
+        WHEN 'HEADMASTER' THEN 3
+    END;
+
+ALTER TABLE student_transfers
+    ALTER COLUMN transfer_type TYPE SMALLINT USING CASE transfer_type::text
+        WHEN 'INCOMING' THEN 0
+        WHEN 'OUTGOING' THEN 1
+    END,
+    ALTER COLUMN status TYPE SMALLINT USING CASE status::text
+        WHEN 'DRAFT' THEN 0
+        WHEN 'SUBMITTED' THEN 1
+        WHEN 'DOCUMENT_VERIFICATION' THEN 2
+        WHEN 'PENDING_APPROVAL' THEN 3
+        WHEN 'APPROVED' THEN 4
+        WHEN 'REJECTED' THEN 5
+        WHEN 'COMPLETED' THEN 6
+    END;
+
+ALTER TABLE transfer_documents
+    ALTER COLUMN document_type TYPE SMALLINT USING CASE document_type::text
+        WHEN 'BIRTH_CERTIFICATE' THEN 0
+        WHEN 'REPORT_CARD' THEN 1
+        WHEN 'FAMILY_CARD' THEN 2
+        WHEN 'TRANSFER_LETTER' THEN 3
+        WHEN 'OTHER' THEN 4
+    END;
+
+-- previous_status is NULL for a transfer's first history entry and stays NULL
+ALTER TABLE transfer_status_history
+    ALTER COLUMN previous_status TYPE SMALLINT USING CASE previous_status::text
+        WHEN 'DRAFT' THEN 0
+        WHEN 'SUBMITTED' THEN 1
+        WHEN 'DOCUMENT_VERIFICATION' THEN 2
+        WHEN 'PENDING_APPROVAL' THEN 3
+        WHEN 'APPROVED' THEN 4
+        WHEN 'REJECTED' THEN 5
+        WHEN 'COMPLETED' THEN 6
+    END,
+    ALTER COLUMN new_status TYPE SMALLINT USING CASE new_status::text
+        WHEN 'DRAFT' THEN 0
+        WHEN 'SUBMITTED' THEN 1
+        WHEN 'DOCUMENT_VERIFICATION' THEN 2
+        WHEN 'PENDING_APPROVAL' THEN 3
+        WHEN 'APPROVED' THEN 4
+        WHEN 'REJECTED' THEN 5
+        WHEN 'COMPLETED' THEN 6
+    END;
+
+ALTER TABLE notifications
+    ALTER COLUMN notification_type TYPE SMALLINT USING CASE notification_type::text
+        WHEN 'TRANSFER_SUBMITTED' THEN 0
+        WHEN 'DOCUMENT_REQUIRED' THEN 1
+        WHEN 'APPROVED' THEN 2
+        WHEN 'REJECTED' THEN 3
+        WHEN 'COMPLETED' THEN 4
+    END;
+
+DROP TYPE userrole, transfertype, transferstatus, documenttype, notificationtype;
+
+COMMIT;
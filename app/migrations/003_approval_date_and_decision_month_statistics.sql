@@ -0,0 +1,37 @@
+-- student_transfers.approval_date becomes TIMESTAMPTZ, and transfer_statistics is rebuilt so approved/rejected
+-- count in the month of the decision (approval_date) rather than the month the transfer was filed.
+-- Run once, after 002 (the counters below compare status and transfer_type as SMALLINT codes):
+--   psql "$APP_DATABASE_URL" -f app/migrations/003_approval_date_and_decision_month_statistics.sql
+
+BEGIN;
+
+-- The old column was a naive TIMESTAMP written with datetime.utcnow()
+ALTER TABLE student_transfers
+    ALTER COLUMN approval_date TYPE TIMESTAMPTZ USING approval_date AT TIME ZONE 'UTC';
+
+-- Same bucketing as the StudentTransfer listeners in app/models_db.py: UTC months, incoming/outgoing and
+-- pending by transfer_date, approved (APPROVED=4, COMPLETED=6) and rejected (REJECTED=5) by approval_date,
+-- falling back to transfer_date for decisions that predate approval_date.
+DELETE FROM transfer_statistics;
+
+-- The listeners upsert ON CONFLICT (year, month); older databases predate uq_stats_ym
+CREATE UNIQUE INDEX IF NOT EXISTS uq_stats_ym ON transfer_statistics (year, month);
+
+INSERT INTO transfer_statistics
+    (year, month, total_incoming, total_outgoing, total_approved, total_rejected, total_pending, created_at, updated_at)
+SELECT extract(year FROM bucket)::int, extract(month FROM bucket)::int,
+       sum(incoming), sum(outgoing), sum(approved), sum(rejected), sum(pending), now(), now()
+FROM (
+    SELECT transfer_date AT TIME ZONE 'UTC' AS bucket,
+           (transfer_type = 0)::int AS incoming, (transfer_type = 1)::int AS outgoing,
+           0 AS approved, 0 AS rejected, (status IN (1, 2, 3))::int AS pending
+    FROM student_transfers
+    UNION ALL
+    SELECT coalesce(approval_date, transfer_date) AT TIME ZONE 'UTC',
+           0, 0, (status IN (4, 6))::int, (status = 5)::int, 0
+    FROM student_transfers
+    WHERE status IN (4, 5, 6)
+) AS contributions
+GROUP BY 1, 2;
+
+COMMIT;
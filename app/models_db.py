@@ -0,0 +1,676 @@
+"""Database side of the models: enums, column types and the SQLModel tables, with the listeners that keep
+denormalized fields and the statistics rollup current. Request/response schemas live in `app.models_schemas`;
+import either through `app.models`.
+"""
+
+from sqlalchemy import cast, event, type_coerce, update
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.types import UserDefinedType
+from sqlalchemy.orm import Mapper, make_transient_to_detached
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, insert
+from sqlalchemy.orm.instrumentation import manager_of_class
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    Column,
+    DateTime,
+    Index,
+    Text,
+    SmallInteger,
+    TypeDecorator,
+    UniqueConstraint,
+    func,
+    text,
+)
+from datetime import UTC, datetime
+from typing import Optional, List, Dict, Any, Literal, Mapping, Tuple, TypeVar, get_args
+from enum import Enum
+import orjson
+
+from app.clock import request_now
+
+__all__ = [
+    # Enums and their Literal aliases
+    "UserRole",
+    "TransferStatus",
+    "TransferType",
+    "DocumentType",
+    "NotificationType",
+    "TransferStatusLit",
+    "TransferTypeLit",
+    "GenderLit",
+    "PriorityLevelLit",
+    # Column types
+    "RawJSONB",
+    "SmallIntEnum",
+    "USER_ROLE_TYPE",
+    "TRANSFER_STATUS_TYPE",
+    "TRANSFER_TYPE_TYPE",
+    "DOCUMENT_TYPE_TYPE",
+    "NOTIFICATION_TYPE_TYPE",
+    "GENDER_TYPE",
+    "PRIORITY_LEVEL_TYPE",
+    "PENDING_STATUSES",
+    # Tables
+    "FastLoadMixin",
+    "User",
+    "School",
+    "Student",
+    "StudentTransfer",
+    "TransferDocument",
+    "TransferStatusHistory",
+    "Notification",
+    "SystemSettings",
+    "AuditLog",
+    "TransferStatistics",
+]
+
+T = TypeVar("T", bound="FastLoadMixin")
+
+
+# Enums for different status and role types
+class UserRole(str, Enum):
+    SCHOOL_ADMIN = "school_admin"
+    TEACHER = "teacher"
+    DISTRICT_OPERATOR = "district_operator"
+    HEADMASTER = "headmaster"
+
+
+class TransferStatus(str, Enum):
+    DRAFT = "draft"
+    SUBMITTED = "submitted"
+    DOCUMENT_VERIFICATION = "document_verification"
+    PENDING_APPROVAL = "pending_approval"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    COMPLETED = "completed"
+
+
+class TransferType(str, Enum):
+    INCOMING = "incoming"
+    OUTGOING = "outgoing"
+
+
+# Literal mirrors of the enums above for filter DTOs: membership is a single set check instead of an
+# Enum value lookup. Keep them in step with the Enum members.
+TransferStatusLit = Literal[
+    "draft", "submitted", "document_verification", "pending_approval", "approved", "rejected", "completed"
+]
+TransferTypeLit = Literal["incoming", "outgoing"]
+
+# Closed vocabularies stored as native Postgres enums (4 bytes per row instead of a VARCHAR);
+# existing databases are converted by app/migrations/001_native_enums_and_smallint_grades.sql
+GenderLit = Literal["Laki-laki", "Perempuan"]
+PriorityLevelLit = Literal["urgent", "normal", "low"]
+
+
+class DocumentType(str, Enum):
+    BIRTH_CERTIFICATE = "birth_certificate"
+    REPORT_CARD = "report_card"
+    FAMILY_CARD = "family_card"
+    TRANSFER_LETTER = "transfer_letter"
+    OTHER = "other"
+
+
+class NotificationType(str, Enum):
+    TRANSFER_SUBMITTED = "transfer_submitted"
+    DOCUMENT_REQUIRED = "document_required"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    COMPLETED = "completed"
+
+
+def _server_timestamp(on_update: bool = False) -> Column:
+    """A timestamp filled in by the database (and refreshed on UPDATE when `on_update`), fetched back via RETURNING."""
+    return Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now() if on_update else None, nullable=False
+    )
+
+
+def _brin_created_at(name: str) -> Index:
+    """A BRIN index on created_at for append-only tables.
+
+    Rows arrive in created_at order, so per-block-range min/max summaries answer time-range scans at a tiny
+    fraction of a BTREE's size.
+    """
+    return Index(name, "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32})
+
+
+class _JSONBText(UserDefinedType):
+    """The JSONB column type with no driver-side processing: values travel as JSON text unchanged.
+
+    A JSONB subclass would be swapped for the dialect's own JSONB (with its json.dumps bind processor).
+    """
+
+    cache_ok = True
+    comparator_factory = JSONB.Comparator
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "JSONB"
+
+
+class RawJSONB(TypeDecorator):
+    """A JSONB column exchanged as raw JSON bytes.
+
+    Values are bound as JSON text and selected as `CAST(... AS TEXT)`, so the driver never runs json.loads on
+    them; callers decode only when they need the data. JSONB containment (`.contains()`, rendered as `@>`)
+    still applies.
+    """
+
+    impl = _JSONBText
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[bytes], dialect: Dialect) -> Optional[str]:
+        return value.decode() if value is not None else None
+
+    def process_result_value(self, value: Optional[str], dialect: Dialect) -> Optional[bytes]:
+        return value.encode() if value is not None else None
+
+    def column_expression(self, column: Any) -> Any:
+        return type_coerce(cast(column, Text), self)
+
+
+class SmallIntEnum(TypeDecorator):
+    """Stores a str Enum as a SMALLINT code and loads it back as the Enum member.
+
+    Codes are the members' declaration positions: only ever append new members, never reorder or remove them.
+    Databases that still have the old native enum columns (member names) are converted by
+    app/migrations/002_smallint_enum_codes.sql.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def code(self, member: Enum) -> int:
+        return self._codes[member]
+
+    def process_bind_param(self, value: Optional[Any], dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+
+USER_ROLE_TYPE = SmallIntEnum(UserRole)
+TRANSFER_STATUS_TYPE = SmallIntEnum(TransferStatus)
+TRANSFER_TYPE_TYPE = SmallIntEnum(TransferType)
+DOCUMENT_TYPE_TYPE = SmallIntEnum(DocumentType)
+NOTIFICATION_TYPE_TYPE = SmallIntEnum(NotificationType)
+GENDER_TYPE = ENUM(*get_args(GenderLit), name="gender_t")
+PRIORITY_LEVEL_TYPE = ENUM(*get_args(PriorityLevelLit), name="priority_t")
+
+# Statuses of transfers still waiting for a decision (the approval queue)
+PENDING_STATUSES = (TransferStatus.SUBMITTED, TransferStatus.DOCUMENT_VERIFICATION, TransferStatus.PENDING_APPROVAL)
+
+
+class FastLoadMixin:
+    @classmethod
+    def from_row_unchecked(cls: type[T], mapping: Mapping[str, Any]) -> T:
+        """Build an instance from a result row mapping without Pydantic validation.
+
+        The values were already constrained by the database. Pydantic's `model_construct` cannot be used here
+        because it replaces `__dict__` and drops the SQLAlchemy instance state, so the instance is created the
+        way the ORM loader does it and then marked detached: adding it to a session later will not INSERT it again.
+        """
+        instance = manager_of_class(cls).new_instance()
+        instance.__dict__.update(mapping)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(mapping))
+        make_transient_to_detached(instance)
+        return instance
+
+
+# Persistent models (stored in database)
+class User(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "users"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    username: str = Field(unique=True, max_length=50)
+    email: str = Field(unique=True, max_length=255)  # format is checked by UserCreate/UserUpdate
+    password_hash: str = Field(max_length=255)
+    full_name: str = Field(max_length=100)
+    role: UserRole = Field(default=UserRole.TEACHER, sa_column=Column(USER_ROLE_TYPE, nullable=False))
+    is_active: bool = Field(default=True)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp(on_update=True))
+    last_login: Optional[datetime] = Field(default=None)
+
+    # Relationships
+    created_transfers: List["StudentTransfer"] = Relationship(
+        back_populates="created_by_user", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.created_by_id"}
+    )
+    approved_transfers: List["StudentTransfer"] = Relationship(
+        back_populates="approved_by_user", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.approved_by_id"}
+    )
+    notifications: List["Notification"] = Relationship(back_populates="user")
+
+
+class School(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "schools"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    npsn: str = Field(unique=True, max_length=20)  # Nomor Pokok Sekolah Nasional
+    name: str = Field(max_length=200)
+    address: str = Field(max_length=500)
+    district: str = Field(max_length=100)
+    regency: str = Field(max_length=100)
+    province: str = Field(max_length=100)
+    postal_code: Optional[str] = Field(default=None, max_length=10)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    email: Optional[str] = Field(default=None, max_length=255)
+    headmaster_name: str = Field(max_length=100)
+    is_active: bool = Field(default=True)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+
+    # Relationships
+    origin_transfers: List["StudentTransfer"] = Relationship(
+        back_populates="origin_school", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.origin_school_id"}
+    )
+    destination_transfers: List["StudentTransfer"] = Relationship(
+        back_populates="destination_school",
+        sa_relationship_kwargs={"foreign_keys": "StudentTransfer.destination_school_id"},
+    )
+
+
+class Student(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "students"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    nisn: str = Field(unique=True, max_length=20)  # National Student Identification Number
+    nis: Optional[str] = Field(default=None, max_length=20)  # School Student Number
+    full_name: str = Field(max_length=100)
+    birth_place: str = Field(max_length=100)
+    birth_date: datetime
+    gender: GenderLit = Field(sa_column=Column(GENDER_TYPE, nullable=False))
+    religion: str = Field(max_length=20)
+    address: str = Field(max_length=500)
+    parent_name: str = Field(max_length=100)
+    parent_phone: Optional[str] = Field(default=None, max_length=20)
+    current_grade: int = Field(sa_type=SmallInteger)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp(on_update=True))
+
+    # Relationships
+    transfers: List["StudentTransfer"] = Relationship(back_populates="student")
+
+
+class StudentTransfer(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "student_transfers"  # type: ignore[assignment]
+    __table_args__ = (
+        # Serves the TransferReportFilter predicates. get_transfer_report reads whole rows, so it still visits the
+        # heap; the INCLUDEd grades only let queries touching just these columns (e.g. per-grade counts) go
+        # index-only.
+        Index(
+            "ix_transfer_report",
+            "academic_year",
+            "status",
+            "transfer_type",
+            "transfer_date",
+            "origin_school_id",
+            "destination_school_id",
+            postgresql_include=["grade_from", "grade_to"],
+        ),
+        Index("ix_transfer_status_date", "status", "transfer_date"),
+        Index("ix_transfer_created_by", "created_by_id", "status"),
+        # Partial index over the small pending fraction of rows; the predicate uses the stored SMALLINT codes
+        Index(
+            "ix_transfer_pending",
+            "destination_school_id",
+            "transfer_date",
+            postgresql_where=text(
+                "status IN ({})".format(
+                    ", ".join(str(TRANSFER_STATUS_TYPE.code(status)) for status in PENDING_STATUSES)
+                )
+            ),
+        ),
+        # transfer_date keeps its BTREE indexes for ORDER BY; range scans on created_at use BRIN
+        _brin_created_at("ix_transfer_created_brin"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    transfer_number: str = Field(unique=True, max_length=50)  # Auto-generated transfer ID
+    student_id: int = Field(foreign_key="students.id")
+    transfer_type: TransferType = Field(sa_column=Column(TRANSFER_TYPE_TYPE, nullable=False))
+    origin_school_id: int = Field(foreign_key="schools.id")
+    destination_school_id: int = Field(foreign_key="schools.id")
+    transfer_reason: str = Field(max_length=1000)
+    status: TransferStatus = Field(default=TransferStatus.DRAFT, sa_column=Column(TRANSFER_STATUS_TYPE, nullable=False))
+    grade_from: int = Field(sa_type=SmallInteger)
+    grade_to: int = Field(sa_type=SmallInteger)
+    semester: str = Field(max_length=10)
+    academic_year: str = Field(max_length=10)  # e.g., "2023/2024"
+    transfer_date: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+
+    # User tracking
+    created_by_id: int = Field(foreign_key="users.id")
+    approved_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    # Set when the status first reaches a decision; the approved/rejected rollup counts by this month
+    approval_date: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    approval_notes: Optional[str] = Field(default=None, max_length=1000)
+
+    # Denormalized display fields, copied at insert and kept in sync by the listeners below
+    student_name: str = Field(max_length=100, index=True)
+    student_nisn: str = Field(max_length=20, index=True)
+    origin_school_name: str = Field(max_length=200)
+    origin_school_npsn: str = Field(max_length=20)
+    destination_school_name: str = Field(max_length=200)
+    destination_school_npsn: str = Field(max_length=20)
+    created_by_name: str = Field(max_length=100)
+
+    # Additional metadata
+    priority_level: PriorityLevelLit = Field(
+        default="normal", sa_column=Column(PRIORITY_LEVEL_TYPE, nullable=False, server_default="normal")
+    )
+    notes: Optional[str] = Field(default=None, max_length=2000)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp(on_update=True))
+
+    # Relationships
+    student: Student = Relationship(back_populates="transfers")
+    origin_school: School = Relationship(
+        back_populates="origin_transfers", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.origin_school_id"}
+    )
+    destination_school: School = Relationship(
+        back_populates="destination_transfers",
+        sa_relationship_kwargs={"foreign_keys": "StudentTransfer.destination_school_id"},
+    )
+    created_by_user: User = Relationship(
+        back_populates="created_transfers", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.created_by_id"}
+    )
+    approved_by_user: Optional[User] = Relationship(
+        back_populates="approved_transfers", sa_relationship_kwargs={"foreign_keys": "StudentTransfer.approved_by_id"}
+    )
+    documents: List["TransferDocument"] = Relationship(back_populates="transfer")
+    status_history: List["TransferStatusHistory"] = Relationship(back_populates="transfer")
+    notifications: List["Notification"] = Relationship(back_populates="transfer")
+
+
+class TransferDocument(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "transfer_documents"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    transfer_id: int = Field(foreign_key="student_transfers.id")
+    document_type: DocumentType = Field(sa_column=Column(DOCUMENT_TYPE_TYPE, nullable=False))
+    file_name: str = Field(max_length=255)
+    file_path: str = Field(max_length=500)
+    file_size: int  # in bytes
+    mime_type: str = Field(max_length=100)
+    is_verified: bool = Field(default=False)
+    verified_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    verified_at: Optional[datetime] = Field(default=None)
+    verification_notes: Optional[str] = Field(default=None, max_length=500)
+    uploaded_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+
+    # Relationships
+    transfer: StudentTransfer = Relationship(back_populates="documents")
+
+
+class TransferStatusHistory(SQLModel, table=True):
+    __tablename__ = "transfer_status_history"  # type: ignore[assignment]
+    __table_args__ = (_brin_created_at("ix_status_history_created_brin"),)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    transfer_id: int = Field(foreign_key="student_transfers.id")
+    previous_status: Optional[TransferStatus] = Field(default=None, sa_column=Column(TRANSFER_STATUS_TYPE))
+    new_status: TransferStatus = Field(sa_column=Column(TRANSFER_STATUS_TYPE, nullable=False))
+    changed_by_id: int = Field(foreign_key="users.id")
+    change_reason: Optional[str] = Field(default=None, max_length=500)
+    notes: Optional[str] = Field(default=None, max_length=1000)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+
+    # Relationships
+    transfer: StudentTransfer = Relationship(back_populates="status_history")
+
+
+class Notification(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "notifications"  # type: ignore[assignment]
+    __table_args__ = (
+        # Partial index for the unread-notification badge
+        Index(
+            "ix_notification_user_unread", "user_id", "is_read", "created_at", postgresql_where=text("is_read = false")
+        ),
+        _brin_created_at("ix_notification_created_brin"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id")
+    transfer_id: Optional[int] = Field(default=None, foreign_key="student_transfers.id")
+    notification_type: NotificationType = Field(sa_column=Column(NOTIFICATION_TYPE_TYPE, nullable=False))
+    title: str = Field(max_length=200)
+    message: str = Field(max_length=1000)
+    is_read: bool = Field(default=False)
+    is_urgent: bool = Field(default=False)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    read_at: Optional[datetime] = Field(default=None)
+
+    # Relationships
+    user: User = Relationship(back_populates="notifications")
+    transfer: Optional[StudentTransfer] = Relationship(back_populates="notifications")
+
+
+class SystemSettings(SQLModel, table=True):
+    __tablename__ = "system_settings"  # type: ignore[assignment]
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    setting_key: str = Field(unique=True, max_length=100)
+    setting_value: str = Field(max_length=1000)
+    description: Optional[str] = Field(default=None, max_length=500)
+    is_active: bool = Field(default=True)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp(on_update=True))
+
+
+class AuditLog(FastLoadMixin, SQLModel, table=True):
+    __tablename__ = "audit_logs"  # type: ignore[assignment]
+    __table_args__ = (
+        # jsonb_ops GIN indexes serve containment lookups (new_values @> '{"role": ...}')
+        Index("ix_audit_new_values", "new_values", postgresql_using="gin"),
+        Index("ix_audit_old_values", "old_values", postgresql_using="gin"),
+        _brin_created_at("ix_audit_created_brin"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id")
+    action: str = Field(max_length=100)  # e.g., "CREATE", "UPDATE", "DELETE", "LOGIN"
+    table_name: str = Field(max_length=50)
+    record_id: Optional[int] = Field(default=None)
+    # Raw orjson-encoded JSON; decoded only on access through the *_dict properties
+    old_values: Optional[bytes] = Field(default=None, sa_column=Column(RawJSONB))
+    new_values: Optional[bytes] = Field(default=None, sa_column=Column(RawJSONB))
+    ip_address: Optional[str] = Field(default=None, max_length=45)
+    user_agent: Optional[str] = Field(default=None, max_length=500)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+
+    @property
+    def old_values_dict(self) -> Optional[Dict[str, Any]]:
+        return orjson.loads(self.old_values) if self.old_values is not None else None
+
+    @old_values_dict.setter
+    def old_values_dict(self, values: Optional[Dict[str, Any]]) -> None:
+        self.old_values = orjson.dumps(values) if values is not None else None
+
+    @property
+    def new_values_dict(self) -> Optional[Dict[str, Any]]:
+        return orjson.loads(self.new_values) if self.new_values is not None else None
+
+    @new_values_dict.setter
+    def new_values_dict(self, values: Optional[Dict[str, Any]]) -> None:
+        self.new_values = orjson.dumps(values) if values is not None else None
+
+
+class TransferStatistics(SQLModel, table=True):
+    __tablename__ = "transfer_statistics"  # type: ignore[assignment]
+    __table_args__ = (UniqueConstraint("year", "month", name="uq_stats_ym"),)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    year: int
+    month: int
+    total_incoming: int = Field(default=0)
+    total_outgoing: int = Field(default=0)
+    total_approved: int = Field(default=0)
+    total_rejected: int = Field(default=0)
+    total_pending: int = Field(default=0)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp(on_update=True))
+
+
+# Keep the denormalized StudentTransfer display fields in sync with their source rows
+def _changed(target: Any, *attributes: str) -> bool:
+    return any(get_history(target, attribute).has_changes() for attribute in attributes)
+
+
+@event.listens_for(Student, "after_update")
+def _sync_transfer_student(mapper: Mapper, connection: Connection, target: Student) -> None:
+    if not _changed(target, "full_name", "nisn"):
+        return
+    connection.execute(
+        update(StudentTransfer)
+        .where(StudentTransfer.student_id == target.id)  # type: ignore[arg-type]
+        .values(student_name=target.full_name, student_nisn=target.nisn)
+    )
+
+
+@event.listens_for(School, "after_update")
+def _sync_transfer_school(mapper: Mapper, connection: Connection, target: School) -> None:
+    if not _changed(target, "name", "npsn"):
+        return
+    connection.execute(
+        update(StudentTransfer)
+        .where(StudentTransfer.origin_school_id == target.id)  # type: ignore[arg-type]
+        .values(origin_school_name=target.name, origin_school_npsn=target.npsn)
+    )
+    connection.execute(
+        update(StudentTransfer)
+        .where(StudentTransfer.destination_school_id == target.id)  # type: ignore[arg-type]
+        .values(destination_school_name=target.name, destination_school_npsn=target.npsn)
+    )
+
+
+@event.listens_for(User, "after_update")
+def _sync_transfer_creator(mapper: Mapper, connection: Connection, target: User) -> None:
+    if not _changed(target, "full_name"):
+        return
+    connection.execute(
+        update(StudentTransfer)
+        .where(StudentTransfer.created_by_id == target.id)  # type: ignore[arg-type]
+        .values(created_by_name=target.full_name)
+    )
+
+
+# Maintain the TransferStatistics (year, month) rollup so the dashboard never aggregates student_transfers.
+# Incoming/outgoing and pending count in the month the transfer was filed (transfer_date); approved and
+# rejected count in the month of the decision (approval_date).
+_STATUS_COUNTERS = {
+    **dict.fromkeys(PENDING_STATUSES, "total_pending"),
+    TransferStatus.APPROVED: "total_approved",
+    TransferStatus.COMPLETED: "total_approved",
+    TransferStatus.REJECTED: "total_rejected",
+}
+_DECIDED_STATUSES = frozenset(status for status, counter in _STATUS_COUNTERS.items() if counter != "total_pending")
+
+
+def _statistics_buckets(
+    transfer_type: TransferType,
+    status: TransferStatus,
+    transfer_date: Optional[datetime],
+    approval_date: Optional[datetime],
+) -> List[Tuple[Optional[datetime], List[str]]]:
+    """The counters one transfer contributes to, grouped by the timestamp whose month they are bucketed in."""
+    filed = ["total_incoming" if transfer_type == TransferType.INCOMING else "total_outgoing"]
+    status_counter = _STATUS_COUNTERS.get(status)
+    if status in _DECIDED_STATUSES:
+        # Decided rows from before approval_date was recorded fall back to the filing month
+        return [(transfer_date, filed), (approval_date or transfer_date, [_STATUS_COUNTERS[status]])]
+    if status_counter is not None:
+        filed.append(status_counter)
+    return [(transfer_date, filed)]
+
+
+def _bump_statistics(
+    connection: Connection, transfer_date: Optional[datetime], counters: List[str], delta: int
+) -> None:
+    # transfer_date comes from its server default and is fetched back by eager_defaults before listeners run
+    assert transfer_date is not None, "transfer_date must be loaded before the statistics rollup"
+    # Months are UTC months whatever the connection's TimeZone, so buckets don't move with the session
+    bucket = transfer_date.astimezone(UTC)
+    table = TransferStatistics.__table__  # type: ignore[attr-defined]
+    statement = insert(table).values(year=bucket.year, month=bucket.month, **dict.fromkeys(counters, delta))
+    statement = statement.on_conflict_do_update(
+        index_elements=["year", "month"],
+        set_={**{counter: table.c[counter] + delta for counter in counters}, "updated_at": func.now()},
+    )
+    connection.execute(statement)
+
+
+def _previous_value(target: StudentTransfer, attribute: str) -> Any:
+    history = get_history(target, attribute)
+    return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+
+_STATISTICS_ATTRIBUTES = ("transfer_type", "status", "transfer_date", "approval_date")
+
+
+def _bump_transfer(connection: Connection, target: StudentTransfer, delta: int, previous: bool = False) -> None:
+    """Add `delta` to every counter the transfer contributes to, using its pre-flush values when `previous`."""
+    read = _previous_value if previous else getattr
+    values = [read(target, attribute) for attribute in _STATISTICS_ATTRIBUTES]
+    for bucket, counters in _statistics_buckets(*values):
+        _bump_statistics(connection, bucket, counters, delta)
+
+
+def _keep_previous_value(target: StudentTransfer, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """No-op "set" listener; registering it with active_history makes the history carry the old value."""
+
+
+# Without active history, setting an attribute that was expired (e.g. after commit) records no old value and
+# the previous bucket would never be decremented. With it, the old value is loaded before the new one is set.
+for _attribute in _STATISTICS_ATTRIBUTES:
+    event.listen(getattr(StudentTransfer, _attribute), "set", _keep_previous_value, active_history=True)
+
+
+@event.listens_for(StudentTransfer, "before_insert")
+@event.listens_for(StudentTransfer, "before_update")
+def _stamp_approval_date(mapper: Mapper, connection: Connection, target: StudentTransfer) -> None:
+    """Record when a transfer is first approved or rejected; APPROVED -> COMPLETED keeps the approval's date."""
+    if target.status in _DECIDED_STATUSES and target.approval_date is None:
+        target.approval_date = request_now()
+
+
+@event.listens_for(StudentTransfer, "after_insert")
+def _count_inserted_transfer(mapper: Mapper, connection: Connection, target: StudentTransfer) -> None:
+    _bump_transfer(connection, target, 1)
+
+
+@event.listens_for(StudentTransfer, "after_update")
+def _count_updated_transfer(mapper: Mapper, connection: Connection, target: StudentTransfer) -> None:
+    if not _changed(target, *_STATISTICS_ATTRIBUTES):
+        return
+    _bump_transfer(connection, target, -1, previous=True)
+    _bump_transfer(connection, target, 1)
+
+
+@event.listens_for(StudentTransfer, "after_delete")
+def _count_deleted_transfer(mapper: Mapper, connection: Connection, target: StudentTransfer) -> None:
+    _bump_transfer(connection, target, -1)
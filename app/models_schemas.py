@@ -0,0 +1,244 @@
+"""Non-persistent schemas (for validation, forms, API requests/responses).
+
+Kept apart from the table models in `app.models_db`: these classes carry no SQLAlchemy state, only Pydantic
+validation. Import them through `app.models`.
+"""
+
+from datetime import UTC, datetime
+from typing import Optional, List, Dict, Any, cast
+import re
+from pydantic import ConfigDict, TypeAdapter, field_validator
+from sqlmodel import SQLModel, Field
+from sqlmodel._compat import SQLModelConfig
+
+from app.models_db import (
+    DocumentType,
+    GenderLit,
+    NotificationType,
+    PriorityLevelLit,
+    TransferStatus,
+    TransferStatusLit,
+    TransferType,
+    TransferTypeLit,
+    UserRole,
+)
+
+__all__ = [
+    "UserCreate",
+    "UserUpdate",
+    "UserLogin",
+    "StudentCreate",
+    "StudentUpdate",
+    "SchoolCreate",
+    "TransferCreate",
+    "TransferUpdate",
+    "TransferApproval",
+    "DocumentUpload",
+    "NotificationCreate",
+    "TransferReportFilter",
+    "DashboardStats",
+    "STUDENT_CREATE_LIST",
+    "TRANSFER_CREATE_LIST",
+    "NOTIFICATION_CREATE_LIST",
+]
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+
+def _check_email(email: Optional[str]) -> Optional[str]:
+    if email is not None and _EMAIL_RE.match(email) is None:
+        raise ValueError("Invalid email address")
+    return email
+
+
+# Shared configs, built once at import: instances are immutable after validation (frozen blocks assignment;
+# schemas with list fields such as DashboardStats are still unhashable), unknown keys are rejected up front
+# and strings are stripped during validation. Pydantic models have no `slots` option, so instances keep
+# their __dict__. The cast matches SQLModel's own `model_config` annotation, which type checkers resolve to
+# sqlmodel's pydantic-v1 compatibility class rather than ConfigDict.
+_SCHEMA_CONFIG = cast(SQLModelConfig, ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True))
+# Passwords must reach the hasher exactly as typed, so credential schemas do not strip whitespace
+_CREDENTIALS_CONFIG = cast(SQLModelConfig, ConfigDict(frozen=True, extra="forbid"))
+
+
+class UserCreate(SQLModel, table=False):
+    model_config = _CREDENTIALS_CONFIG
+
+    username: str = Field(max_length=50)
+    email: str = Field(max_length=255)
+    password: str = Field(min_length=8, max_length=100)
+    full_name: str = Field(max_length=100)
+    role: UserRole = Field(default=UserRole.TEACHER)
+    phone: Optional[str] = Field(default=None, max_length=20)
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, email: Optional[str]) -> Optional[str]:
+        return _check_email(email)
+
+
+class UserUpdate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    username: Optional[str] = Field(default=None, max_length=50)
+    email: Optional[str] = Field(default=None, max_length=255)
+    full_name: Optional[str] = Field(default=None, max_length=100)
+    role: Optional[UserRole] = Field(default=None)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    is_active: Optional[bool] = Field(default=None)
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, email: Optional[str]) -> Optional[str]:
+        return _check_email(email)
+
+
+class UserLogin(SQLModel, table=False):
+    model_config = _CREDENTIALS_CONFIG
+
+    username: str = Field(max_length=50)
+    password: str = Field(max_length=100)
+
+
+class StudentCreate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    nisn: str = Field(max_length=20)
+    nis: Optional[str] = Field(default=None, max_length=20)
+    full_name: str = Field(max_length=100)
+    birth_place: str = Field(max_length=100)
+    birth_date: datetime
+    gender: GenderLit
+    religion: str = Field(max_length=20)
+    address: str = Field(max_length=500)
+    parent_name: str = Field(max_length=100)
+    parent_phone: Optional[str] = Field(default=None, max_length=20)
+    current_grade: int = Field(ge=1, le=12)
+
+
+class StudentUpdate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    nis: Optional[str] = Field(default=None, max_length=20)
+    full_name: Optional[str] = Field(default=None, max_length=100)
+    birth_place: Optional[str] = Field(default=None, max_length=100)
+    birth_date: Optional[datetime] = Field(default=None)
+    gender: Optional[GenderLit] = Field(default=None)
+    religion: Optional[str] = Field(default=None, max_length=20)
+    address: Optional[str] = Field(default=None, max_length=500)
+    parent_name: Optional[str] = Field(default=None, max_length=100)
+    parent_phone: Optional[str] = Field(default=None, max_length=20)
+    current_grade: Optional[int] = Field(default=None, ge=1, le=12)
+
+
+class SchoolCreate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    npsn: str = Field(max_length=20)
+    name: str = Field(max_length=200)
+    address: str = Field(max_length=500)
+    district: str = Field(max_length=100)
+    regency: str = Field(max_length=100)
+    province: str = Field(max_length=100)
+    postal_code: Optional[str] = Field(default=None, max_length=10)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    email: Optional[str] = Field(default=None, max_length=255)
+    headmaster_name: str = Field(max_length=100)
+
+
+class TransferCreate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    student_id: int
+    transfer_type: TransferType
+    origin_school_id: int
+    destination_school_id: int
+    transfer_reason: str = Field(max_length=1000)
+    grade_from: int = Field(ge=1, le=12)
+    grade_to: int = Field(ge=1, le=12)
+    semester: str = Field(max_length=10)
+    academic_year: str = Field(max_length=10)
+    priority_level: PriorityLevelLit = Field(default="normal")
+    notes: Optional[str] = Field(default=None, max_length=2000)
+
+
+class TransferUpdate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    transfer_reason: Optional[str] = Field(default=None, max_length=1000)
+    status: Optional[TransferStatus] = Field(default=None)
+    grade_from: Optional[int] = Field(default=None, ge=1, le=12)
+    grade_to: Optional[int] = Field(default=None, ge=1, le=12)
+    semester: Optional[str] = Field(default=None, max_length=10)
+    academic_year: Optional[str] = Field(default=None, max_length=10)
+    priority_level: Optional[PriorityLevelLit] = Field(default=None)
+    notes: Optional[str] = Field(default=None, max_length=2000)
+    approval_notes: Optional[str] = Field(default=None, max_length=1000)
+
+
+class TransferApproval(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    status: TransferStatus
+    approval_notes: str = Field(max_length=1000)
+
+
+class DocumentUpload(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    document_type: DocumentType
+    file_name: str = Field(max_length=255)
+    file_size: int
+    mime_type: str = Field(max_length=100)
+
+
+class NotificationCreate(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    user_id: int
+    transfer_id: Optional[int] = Field(default=None)
+    notification_type: NotificationType
+    title: str = Field(max_length=200)
+    message: str = Field(max_length=1000)
+    is_urgent: bool = Field(default=False)
+
+
+class TransferReportFilter(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    # Range bounds are unix epoch milliseconds: the UI builds this filter constantly and ints validate far
+    # cheaper than datetimes. The report binds them straight to to_timestamp() in SQL.
+    start_ts_ms: Optional[int] = Field(default=None, ge=0)
+    end_ts_ms: Optional[int] = Field(default=None, ge=0)
+    status: Optional[TransferStatusLit] = Field(default=None)
+    transfer_type: Optional[TransferTypeLit] = Field(default=None)
+    origin_school_id: Optional[int] = Field(default=None)
+    destination_school_id: Optional[int] = Field(default=None)
+    grade: Optional[int] = Field(default=None, ge=1, le=12)
+    academic_year: Optional[str] = Field(default=None, max_length=10)
+
+    @property
+    def start_date(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.start_ts_ms / 1000, tz=UTC) if self.start_ts_ms is not None else None
+
+    @property
+    def end_date(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.end_ts_ms / 1000, tz=UTC) if self.end_ts_ms is not None else None
+
+
+class DashboardStats(SQLModel, table=False):
+    model_config = _SCHEMA_CONFIG
+
+    total_transfers: int = Field(default=0)
+    total_incoming: int = Field(default=0)
+    total_outgoing: int = Field(default=0)
+    pending_approvals: int = Field(default=0)
+    approved_this_month: int = Field(default=0)
+    rejected_this_month: int = Field(default=0)
+    monthly_trends: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+# Validators for bulk payloads, built once: a whole batch is validated in a single pydantic-core call
+STUDENT_CREATE_LIST = TypeAdapter(List[StudentCreate])
+TRANSFER_CREATE_LIST = TypeAdapter(List[TransferCreate])
+NOTIFICATION_CREATE_LIST = TypeAdapter(List[NotificationCreate])
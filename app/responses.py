@@ -0,0 +1,53 @@
+"""orjson-backed JSON responses.
+
+FastAPI runs `jsonable_encoder` on whatever a route returns unless it is already a `Response`; only the
+final `json.dumps` step is replaced when `ORJSONResponse` is the default response class. So on that path
+`orjson_default` is never reached and pre-encoded bytes (e.g. `AuditLog.new_values`) would be encoded a second
+time. Handlers that need orjson end to end return `orjson_response(obj)`, which skips `jsonable_encoder` and
+`response_model` validation.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _FastAPIORJSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def orjson_default(obj: Any) -> Any:
+    """Convert values orjson cannot serialize on its own."""
+    match obj:
+        case bytes():
+            # bytes in a payload are pre-encoded JSON (e.g. AuditLog.old_values); embed them without re-encoding
+            return orjson.Fragment(obj)
+        case BaseModel():
+            return obj.model_dump()
+        case Enum():
+            return obj.value
+        case datetime() | date() | time():
+            return obj.isoformat()
+        case Decimal():
+            return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(_FastAPIORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        # Already-encoded payloads (e.g. from `dumps`) are sent as-is
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def orjson_response(content: Any, status_code: int = 200) -> ORJSONResponse:
+    """Encode `content` with `dumps` up front so FastAPI sends it without running jsonable_encoder."""
+    return ORJSONResponse(dumps(content), status_code=status_code)
@@ -0,0 +1,73 @@
+"""msgspec response shapes for hot read paths.
+
+These mirror read-only views of the SQLModel tables. They are built straight from result rows and encoded by
+msgspec, so no Pydantic validation or `model_dump` happens on the way out. Input schemas (`*Create`, `*Update`)
+stay on SQLModel/Pydantic in `app/models_schemas.py` because they validate untrusted data.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import msgspec
+from starlette.responses import Response
+
+from app.models import PriorityLevelLit, TransferStatus, TransferType
+
+
+class StudentTransferRead(msgspec.Struct, gc=False):
+    id: int
+    transfer_number: str
+    student_id: int
+    transfer_type: TransferType
+    origin_school_id: int
+    destination_school_id: int
+    transfer_reason: str
+    status: TransferStatus
+    grade_from: int
+    grade_to: int
+    semester: str
+    academic_year: str
+    transfer_date: datetime
+    created_by_id: int
+    approved_by_id: Optional[int]
+    approval_date: Optional[datetime]
+    approval_notes: Optional[str]
+    student_name: str
+    student_nisn: str
+    origin_school_name: str
+    origin_school_npsn: str
+    destination_school_name: str
+    destination_school_npsn: str
+    created_by_name: str
+    priority_level: PriorityLevelLit
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class DashboardStatsRead(msgspec.Struct):
+    total_transfers: int = 0
+    total_incoming: int = 0
+    total_outgoing: int = 0
+    pending_approvals: int = 0
+    approved_this_month: int = 0
+    rejected_this_month: int = 0
+    monthly_trends: List[Dict[str, Any]] = msgspec.field(default_factory=list)
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def encode(obj: Any) -> bytes:
+    return _ENCODER.encode(obj)
+
+
+def msgspec_response(obj: Any) -> Response:
+    return Response(content=_ENCODER.encode(obj), media_type="application/json")
+
+
+def rows_response(columns: Sequence[str], rows: List[Tuple[Any, ...]]) -> Response:
+    """Encode plain row tuples as {"columns": [...], "rows": [[...], ...]} without building per-row objects."""
+    buffer = bytearray()
+    _ENCODER.encode_into({"columns": columns, "rows": rows}, buffer)
+    return Response(content=memoryview(buffer), media_type="application/json")
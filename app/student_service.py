@@ -0,0 +1,18 @@
+from typing import Any, Dict, List
+
+from sqlmodel import Session, insert
+
+from app.models import STUDENT_CREATE_LIST, Student
+
+
+def bulk_create_students(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """Validate a batch of raw student rows (e.g. from a CSV import) and insert them with one multi-row INSERT.
+
+    Raises pydantic.ValidationError, with the offending row indices, before anything is written.
+    """
+    students = STUDENT_CREATE_LIST.validate_python(rows)
+    if not students:
+        return 0
+    session.execute(insert(Student), [student.model_dump() for student in students])
+    session.commit()
+    return len(students)
@@ -0,0 +1,173 @@
+from typing import Any, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import Session, desc, func, or_, select
+
+from app.clock import request_now
+from app.models import (
+    PENDING_STATUSES,
+    School,
+    Student,
+    StudentTransfer,
+    TransferCreate,
+    TransferReportFilter,
+    TransferStatus,
+    User,
+)
+from app.schemas_fast import StudentTransferRead
+
+# Columns selected in StudentTransferRead field order so rows can be passed to the constructor positionally
+_READ_COLUMNS = tuple(StudentTransfer.__table__.c[name] for name in StudentTransferRead.__struct_fields__)  # type: ignore[attr-defined]
+
+# Columns of the compact list rows returned by list_transfers_fast
+FAST_LIST_COLUMNS = (
+    "id",
+    "transfer_number",
+    "status",
+    "transfer_date",
+    "student_name",
+    "origin_school_name",
+    "destination_school_name",
+)
+_FAST_LIST_SELECT = tuple(StudentTransfer.__table__.c[name] for name in FAST_LIST_COLUMNS)  # type: ignore[attr-defined]
+
+# List views only show denormalized columns and the document count; any other relationship access raises
+# instead of silently issuing one SELECT per row
+LIST_OPTIONS = (selectinload(StudentTransfer.documents), raiseload("*"))  # type: ignore[arg-type]
+
+# Detail view: one IN-clause query per relationship, fetching only the columns the page shows
+DETAIL_OPTIONS = (
+    selectinload(StudentTransfer.documents),  # type: ignore[arg-type]
+    selectinload(StudentTransfer.status_history),  # type: ignore[arg-type]
+    selectinload(StudentTransfer.origin_school).load_only(School.name, School.npsn),  # type: ignore[arg-type]
+    selectinload(StudentTransfer.destination_school).load_only(School.name, School.npsn),  # type: ignore[arg-type]
+    selectinload(StudentTransfer.student).load_only(Student.full_name, Student.nisn, Student.current_grade),  # type: ignore[arg-type]
+)
+
+
+def _new_transfer_number() -> str:
+    return f"MUT-{request_now():%Y%m%d}-{uuid4().hex[:8].upper()}"
+
+
+def create_transfer(session: Session, data: TransferCreate, created_by_id: int) -> StudentTransfer:
+    """Create a draft transfer, copying the display names the list view needs onto the row."""
+    student = session.get(Student, data.student_id)
+    if student is None:
+        raise ValueError(f"Student {data.student_id} not found")
+    origin = session.get(School, data.origin_school_id)
+    if origin is None:
+        raise ValueError(f"Origin school {data.origin_school_id} not found")
+    destination = session.get(School, data.destination_school_id)
+    if destination is None:
+        raise ValueError(f"Destination school {data.destination_school_id} not found")
+    creator = session.get(User, created_by_id)
+    if creator is None:
+        raise ValueError(f"User {created_by_id} not found")
+
+    transfer = StudentTransfer(
+        **data.model_dump(),
+        transfer_number=_new_transfer_number(),
+        created_by_id=created_by_id,
+        student_name=student.full_name,
+        student_nisn=student.nisn,
+        origin_school_name=origin.name,
+        origin_school_npsn=origin.npsn,
+        destination_school_name=destination.name,
+        destination_school_npsn=destination.npsn,
+        created_by_name=creator.full_name,
+    )
+    session.add(transfer)
+    session.commit()
+    session.refresh(transfer)
+    return transfer
+
+
+def list_transfers(session: Session, limit: int = 50, offset: int = 0) -> List[StudentTransferRead]:
+    """Newest transfers first, as msgspec structs ready for encoding."""
+    statement = select(*_READ_COLUMNS).order_by(desc(StudentTransfer.transfer_date)).offset(offset).limit(limit)
+    return [StudentTransferRead(*row) for row in session.exec(statement)]
+
+
+def list_transfers_fast(
+    session: Session, limit: int = 50, status: Optional[TransferStatus] = None
+) -> List[Tuple[Any, ...]]:
+    """Newest transfers first as plain tuples in FAST_LIST_COLUMNS order; no ORM or Pydantic objects are built."""
+    statement = select(*_FAST_LIST_SELECT)
+    if status is not None:
+        statement = statement.where(StudentTransfer.status == status)
+    statement = statement.order_by(desc(StudentTransfer.transfer_date)).limit(limit)
+    return [tuple(row) for row in session.exec(statement)]
+
+
+def list_transfers_with_documents(session: Session, limit: int = 50, offset: int = 0) -> List[StudentTransfer]:
+    """Newest transfers first with their documents loaded in one extra query and every other relationship blocked."""
+    statement = (
+        select(StudentTransfer)
+        .options(*LIST_OPTIONS)
+        .order_by(desc(StudentTransfer.transfer_date))
+        .offset(offset)
+        .limit(limit)
+    )
+    return list(session.exec(statement).all())
+
+
+def _pending_approvals_select(destination_school_id: int, limit: int) -> Any:
+    return (
+        select(*_READ_COLUMNS)
+        .where(StudentTransfer.destination_school_id == destination_school_id)
+        .where(StudentTransfer.status.in_(PENDING_STATUSES))  # type: ignore[attr-defined]
+        .order_by(StudentTransfer.transfer_date)
+        .limit(limit)
+    )
+
+
+def list_pending_approvals(session: Session, destination_school_id: int, limit: int = 50) -> List[StudentTransferRead]:
+    """Transfers into a school still awaiting a decision, oldest first (served by ix_transfer_pending)."""
+    statement = _pending_approvals_select(destination_school_id, limit)
+    return [StudentTransferRead(*row) for row in session.exec(statement)]
+
+
+def get_transfer_detail(session: Session, transfer_id: int) -> Optional[StudentTransfer]:
+    """A transfer with its documents, status history, schools and student loaded up front."""
+    statement = select(StudentTransfer).options(*DETAIL_OPTIONS).where(StudentTransfer.id == transfer_id)
+    return session.exec(statement).first()
+
+
+def get_student_transfers(session: Session, student_id: int) -> List[StudentTransfer]:
+    """All transfers of a student, newest first, loaded as plain rows without validation."""
+    table = StudentTransfer.__table__  # type: ignore[attr-defined]
+    statement = select(*table.c).where(table.c.student_id == student_id).order_by(desc(table.c.transfer_date))
+    return [StudentTransfer.from_row_unchecked(row._mapping) for row in session.exec(statement)]
+
+
+def get_transfer_report(session: Session, report_filter: TransferReportFilter) -> List[StudentTransferRead]:
+    """Transfers matching the report filter, newest first.
+
+    Status and type Literals are bound as their SMALLINT codes by the column types (SmallIntEnum coerces the
+    string to its Enum member), so they compare as integers in ix_transfer_report. Date bounds go to Postgres'
+    to_timestamp() as epoch numbers; no datetime is built here.
+    """
+    statement = select(*_READ_COLUMNS)
+    if report_filter.academic_year is not None:
+        statement = statement.where(StudentTransfer.academic_year == report_filter.academic_year)
+    if report_filter.status is not None:
+        statement = statement.where(StudentTransfer.status == report_filter.status)
+    if report_filter.transfer_type is not None:
+        statement = statement.where(StudentTransfer.transfer_type == report_filter.transfer_type)
+    if report_filter.start_ts_ms is not None:
+        statement = statement.where(
+            StudentTransfer.transfer_date >= func.to_timestamp(report_filter.start_ts_ms / 1000)
+        )
+    if report_filter.end_ts_ms is not None:
+        statement = statement.where(StudentTransfer.transfer_date <= func.to_timestamp(report_filter.end_ts_ms / 1000))
+    if report_filter.origin_school_id is not None:
+        statement = statement.where(StudentTransfer.origin_school_id == report_filter.origin_school_id)
+    if report_filter.destination_school_id is not None:
+        statement = statement.where(StudentTransfer.destination_school_id == report_filter.destination_school_id)
+    if report_filter.grade is not None:
+        statement = statement.where(
+            or_(StudentTransfer.grade_from == report_filter.grade, StudentTransfer.grade_to == report_filter.grade)
+        )
+    statement = statement.order_by(desc(StudentTransfer.transfer_date))
+    return [StudentTransferRead(*row) for row in session.exec(statement)]
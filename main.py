@@ -1,5 +1,7 @@
 import logging
 import os
+from app.clock import RequestClockMiddleware
+from app.responses import ORJSONResponse
 from app.startup import startup
 from nicegui import app, ui
 from fastapi import FastAPI
@@ -21,6 +23,11 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# render plain route results with orjson instead of json.dumps; FastAPI still runs jsonable_encoder on them
+# first, so handlers returning models or pre-encoded JSON use app.responses.orjson_response()
+app.router.default_response_class = ORJSONResponse
+
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "service": "nicegui-app"}
@@ -33,6 +40,7 @@ app.on_startup(startup)
 
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(RequestClockMiddleware)
 
 ui.run(
     host="0.0.0.0",
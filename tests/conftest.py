@@ -1,12 +1,83 @@
+from datetime import UTC, datetime
 from typing import Generator
 import pytest
+from app.database import get_session, reset_db
+from app.models import School, Student, TransferCreate, TransferStatus, TransferType, User
 from app.startup import startup
-from nicegui.testing import User
+from app.transfer_service import create_transfer
+from nicegui.testing import User as TestUser
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
 
 @pytest.fixture
-def user(user: User) -> Generator[User, None, None]:
+def user(user: TestUser) -> Generator[TestUser, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture
+def clean_db() -> Generator[None, None, None]:
+    reset_db()
+    yield
+    reset_db()
+
+
+def _school(npsn: str, name: str) -> School:
+    return School(
+        npsn=npsn,
+        name=name,
+        address="Jl. Merdeka 1",
+        district="Coblong",
+        regency="Kota Bandung",
+        province="Jawa Barat",
+        headmaster_name="Budi Santoso",
+    )
+
+
+@pytest.fixture
+def sample_transfers(clean_db) -> list[int]:
+    with get_session() as session:
+        operator = User(username="operator", email="operator@example.com", password_hash="x", full_name="Siti Operator")
+        origin = _school("20219001", "SD Negeri 1 Bandung")
+        destination = _school("20219002", "SD Negeri 2 Bandung")
+        student = Student(
+            nisn="0123456789",
+            full_name="Andi Pratama",
+            birth_place="Bandung",
+            birth_date=datetime(2015, 5, 17),
+            gender="Laki-laki",
+            religion="Islam",
+            address="Jl. Dago 10",
+            parent_name="Rahmat Pratama",
+            current_grade=3,
+        )
+        session.add_all([operator, origin, destination, student])
+        session.commit()
+        assert operator.id is not None and origin.id is not None and destination.id is not None
+        assert student.id is not None
+
+        transfer_ids = []
+        for day in (1, 2, 3):
+            transfer = create_transfer(
+                session,
+                TransferCreate(
+                    student_id=student.id,
+                    transfer_type=TransferType.OUTGOING,
+                    origin_school_id=origin.id,
+                    destination_school_id=destination.id,
+                    transfer_reason="Orang tua pindah tugas",
+                    grade_from=3,
+                    grade_to=3,
+                    semester="1",
+                    academic_year="2024/2025",
+                ),
+                created_by_id=operator.id,
+            )
+            transfer.transfer_number = f"MUT-2024-00{day}"
+            transfer.status = TransferStatus.SUBMITTED
+            transfer.transfer_date = datetime(2024, 7, day, tzinfo=UTC)
+            session.commit()
+            assert transfer.id is not None
+            transfer_ids.append(transfer.id)
+        return transfer_ids
@@ -0,0 +1,95 @@
+import pytest
+from sqlmodel import Session
+
+from app.audit_service import AuditBuffer, find_audit_logs
+from app.database import get_session
+from app.models import AuditLog, User, UserRole
+
+
+def _audit(user_id: int, record_id: int, old: dict, new: dict) -> AuditLog:
+    audit = AuditLog(user_id=user_id, action="UPDATE", table_name="users", record_id=record_id)
+    audit.old_values_dict = old
+    audit.new_values_dict = new
+    return audit
+
+
+def _admin_id(session: Session) -> int:
+    admin = User(username="admin", email="admin@example.com", password_hash="x", full_name="Admin")
+    session.add(admin)
+    session.commit()
+    assert admin.id is not None
+    return admin.id
+
+
+def test_audit_values_round_trip_as_raw_json(clean_db):
+    with get_session() as session:
+        admin_id = _admin_id(session)
+        audit = _audit(admin_id, 1, {"role": "teacher"}, {"role": "headmaster", "is_active": True})
+        session.add(audit)
+        session.commit()
+        audit_id = audit.id
+
+    with get_session() as session:
+        audit = session.get(AuditLog, audit_id)
+
+    assert audit is not None
+    assert isinstance(audit.new_values, bytes)
+    assert audit.new_values_dict == {"role": "headmaster", "is_active": True}
+    assert audit.old_values_dict == {"role": "teacher"}
+
+
+def test_find_audit_logs_by_contained_values(clean_db):
+    with get_session() as session:
+        admin_id = _admin_id(session)
+        session.add_all(
+            [
+                _audit(admin_id, 1, {"role": "teacher"}, {"role": "headmaster"}),
+                _audit(admin_id, 2, {"role": "teacher"}, {"role": "school_admin"}),
+                _audit(admin_id, 3, {"phone": None}, {"phone": "0812"}),
+            ]
+        )
+        session.commit()
+
+        promoted = find_audit_logs(session, new_values={"role": UserRole.HEADMASTER.value})
+        from_teacher = find_audit_logs(session, table_name="users", old_values={"role": "teacher"})
+        other_table = find_audit_logs(session, table_name="students")
+
+    assert [a.record_id for a in promoted] == [1]
+    assert [a.record_id for a in from_teacher] == [2, 1]
+    assert other_table == []
+
+
+def test_audit_buffer_copies_rows_on_commit(clean_db):
+    with get_session() as session:
+        admin = User(username="admin", email="admin@example.com", password_hash="x", full_name="Admin")
+        session.add(admin)
+        with AuditBuffer(session) as audit:
+            # the audit rows reference a user that is only flushed, not committed, when the COPY runs
+            session.flush()
+            assert admin.id is not None
+            audit.add(admin.id, "CREATE", "users", admin.id, new_values={"username": "admin"})
+            audit.add(admin.id, "UPDATE", "users", admin.id, {"note": None}, {"note": "tab\there\nline \\ end"})
+            audit.add(admin.id, "LOGIN", "users", user_agent="Mozilla/5.0")
+            session.commit()
+            assert len(audit) == 0
+
+    with get_session() as session:
+        logs = find_audit_logs(session)
+
+    assert [log.action for log in logs] == ["LOGIN", "UPDATE", "CREATE"]
+    assert logs[0].new_values is None and logs[0].user_agent == "Mozilla/5.0"
+    assert logs[1].new_values_dict == {"note": "tab\there\nline \\ end"}
+    assert logs[1].old_values_dict == {"note": None}
+    assert all(log.created_at is not None for log in logs)
+
+
+def test_audit_buffer_drops_rows_on_error(clean_db):
+    with get_session() as session:
+        admin_id = _admin_id(session)
+        with pytest.raises(RuntimeError):
+            with AuditBuffer(session) as audit:
+                audit.add(admin_id, "DELETE", "users", admin_id)
+                raise RuntimeError("boom")
+        session.commit()
+
+        assert find_audit_logs(session) == []
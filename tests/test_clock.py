@@ -0,0 +1,40 @@
+import asyncio
+from datetime import UTC, datetime
+
+from starlette.types import Message, Receive, Scope, Send
+
+from app.clock import RequestClockMiddleware, frozen_now, request_now
+from app.transfer_service import _new_transfer_number
+
+
+def test_request_now_is_pinned_inside_frozen_now():
+    with frozen_now() as now:
+        assert request_now() is now
+        assert request_now() is now
+
+    assert request_now() is not now
+
+
+def test_transfer_number_uses_the_request_clock():
+    with frozen_now(datetime(2024, 7, 1, 23, 59, tzinfo=UTC)):
+        assert _new_transfer_number().startswith("MUT-20240701-")
+
+
+def test_middleware_pins_one_timestamp_per_request():
+    seen = []
+
+    async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+        seen.append((request_now(), request_now()))
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:
+        pass
+
+    middleware = RequestClockMiddleware(endpoint)
+    asyncio.run(middleware({"type": "http"}, receive, send))
+    asyncio.run(middleware({"type": "http"}, receive, send))
+
+    assert seen[0][0] is seen[0][1]
+    assert seen[1][0] is not seen[0][0]
@@ -0,0 +1,113 @@
+from datetime import UTC, date, datetime
+
+from sqlmodel import select
+
+from app.clock import frozen_now
+from app.dashboard_service import get_dashboard_stats
+from app.database import get_session
+from app.models import StudentTransfer, TransferStatistics, TransferStatus
+
+
+def test_statistics_follow_transfer_inserts_and_updates(sample_transfers):
+    with get_session() as session:
+        rows = session.exec(select(TransferStatistics).where(TransferStatistics.total_outgoing != 0)).all()
+
+    assert [(row.year, row.month) for row in rows] == [(2024, 7)]
+    assert rows[0].total_outgoing == 3
+    assert rows[0].total_pending == 3
+    assert rows[0].total_approved == 0
+
+
+def test_status_transition_moves_counts(sample_transfers):
+    with get_session() as session:
+        approved = session.get(StudentTransfer, sample_transfers[0])
+        rejected = session.get(StudentTransfer, sample_transfers[1])
+        assert approved is not None and rejected is not None
+        with frozen_now(datetime(2024, 7, 15, tzinfo=UTC)):
+            approved.status = TransferStatus.APPROVED
+            rejected.status = TransferStatus.REJECTED
+            session.commit()
+
+        stats = get_dashboard_stats(session, today=date(2024, 7, 20))
+
+    assert stats.total_transfers == 3
+    assert stats.total_outgoing == 3
+    assert stats.total_incoming == 0
+    assert stats.pending_approvals == 1
+    assert stats.approved_this_month == 1
+    assert stats.rejected_this_month == 1
+
+
+def test_status_transition_on_expired_instance_moves_counts(sample_transfers):
+    with get_session() as session:
+        transfer = session.get(StudentTransfer, sample_transfers[0])
+        assert transfer is not None
+        transfer.notes = "Berkas lengkap"
+        session.commit()
+
+        # every attribute is expired after the commit; the old status must still be decremented
+        with frozen_now(datetime(2024, 7, 15, tzinfo=UTC)):
+            transfer.status = TransferStatus.APPROVED
+            session.commit()
+        transfer.transfer_date = datetime(2024, 5, 10, tzinfo=UTC)
+        session.commit()
+
+        stats = get_dashboard_stats(session, today=date(2024, 7, 20), months=3)
+
+    # the filing moves to May, the approval stays in the month it was decided
+    assert stats.pending_approvals == 2
+    assert stats.approved_this_month == 1
+    assert [(t["month"], t["outgoing"], t["pending"], t["approved"]) for t in stats.monthly_trends] == [
+        (5, 1, 0, 0),
+        (6, 0, 0, 0),
+        (7, 2, 2, 1),
+    ]
+
+
+def test_decisions_count_in_the_month_they_are_made(sample_transfers):
+    with get_session() as session:
+        approved = session.get(StudentTransfer, sample_transfers[0])
+        rejected = session.get(StudentTransfer, sample_transfers[1])
+        assert approved is not None and rejected is not None
+        with frozen_now(datetime(2024, 8, 2, tzinfo=UTC)) as decided_at:
+            approved.status = TransferStatus.APPROVED
+            rejected.status = TransferStatus.REJECTED
+            session.commit()
+        # completing an approved transfer keeps it in the approval's month
+        approved.status = TransferStatus.COMPLETED
+        session.commit()
+        assert approved.approval_date == decided_at
+
+        filed = get_dashboard_stats(session, today=date(2024, 7, 20), months=2)
+        decided = get_dashboard_stats(session, today=date(2024, 8, 20), months=2)
+
+    assert (filed.approved_this_month, filed.rejected_this_month) == (0, 0)
+    assert (decided.approved_this_month, decided.rejected_this_month) == (1, 1)
+    assert [
+        (t["month"], t["outgoing"], t["pending"], t["approved"], t["rejected"]) for t in decided.monthly_trends
+    ] == [
+        (7, 3, 1, 0, 0),
+        (8, 0, 0, 1, 1),
+    ]
+
+
+def test_dashboard_trends_cover_recent_months(sample_transfers):
+    with get_session() as session:
+        transfer = session.get(StudentTransfer, sample_transfers[2])
+        assert transfer is not None
+        transfer.transfer_date = datetime(2024, 5, 10, tzinfo=UTC)
+        session.commit()
+
+        stats = get_dashboard_stats(session, today=date(2024, 8, 1), months=4)
+
+    assert [(t["year"], t["month"]) for t in stats.monthly_trends] == [(2024, 5), (2024, 6), (2024, 7), (2024, 8)]
+    assert [t["outgoing"] for t in stats.monthly_trends] == [1, 0, 2, 0]
+    assert stats.approved_this_month == 0
+
+
+def test_dashboard_trends_cross_year_boundary(clean_db):
+    with get_session() as session:
+        stats = get_dashboard_stats(session, today=date(2025, 2, 3), months=3)
+
+    assert [(t["year"], t["month"]) for t in stats.monthly_trends] == [(2024, 12), (2025, 1), (2025, 2)]
+    assert stats.total_transfers == 0
@@ -0,0 +1,131 @@
+from datetime import UTC, datetime
+from typing import get_args
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import text
+
+from app.database import get_session
+from app.models import (
+    NOTIFICATION_CREATE_LIST,
+    NotificationCreate,
+    NotificationType,
+    Student,
+    TransferReportFilter,
+    TransferStatus,
+    TransferStatusLit,
+    TransferType,
+    TransferTypeLit,
+    UserCreate,
+    UserLogin,
+    UserUpdate,
+)
+
+
+def test_user_create_accepts_valid_email():
+    user = UserCreate(username="siti", email="siti.rahma@sekolah.id", password="rahasia123", full_name="Siti Rahma")
+
+    assert user.email == "siti.rahma@sekolah.id"
+
+
+def test_user_create_rejects_invalid_email():
+    with pytest.raises(ValidationError, match="Invalid email address"):
+        UserCreate(username="siti", email="siti-at-sekolah", password="rahasia123", full_name="Siti Rahma")
+
+
+def test_user_update_checks_email_only_when_given():
+    assert UserUpdate(full_name="Siti Rahma").email is None
+
+    with pytest.raises(ValidationError, match="Invalid email address"):
+        UserUpdate(email="not an email")
+
+
+def test_timestamps_are_filled_in_by_the_database(clean_db):
+    with get_session() as session:
+        student = Student(
+            nisn="0099887766",
+            full_name="Dewi Lestari",
+            birth_place="Bogor",
+            birth_date=datetime(2016, 2, 9),
+            gender="Perempuan",
+            religion="Kristen",
+            address="Jl. Pajajaran 5",
+            parent_name="Agus Lestari",
+            current_grade=2,
+        )
+        session.add(student)
+        session.flush()
+        assert student.created_at is not None
+        assert student.updated_at == student.created_at
+        session.commit()
+
+        student.address = "Jl. Pajajaran 7"
+        session.commit()
+
+        assert student.updated_at is not None and student.created_at is not None
+        assert student.updated_at > student.created_at
+
+
+def test_request_schemas_are_frozen_and_strict():
+    report_filter = TransferReportFilter(academic_year=" 2024/2025 ")
+
+    assert report_filter.academic_year == "2024/2025"
+    with pytest.raises(ValidationError):
+        report_filter.academic_year = "2023/2024"
+    with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+        TransferReportFilter.model_validate({"school": "SD Negeri 1"})
+
+
+def test_report_filter_exposes_bounds_as_datetimes():
+    report_filter = TransferReportFilter(start_ts_ms=1719792000000)
+
+    assert report_filter.start_date == datetime(2024, 7, 1, tzinfo=UTC)
+    assert report_filter.end_date is None
+
+
+def test_report_filter_literals_match_the_enums():
+    assert get_args(TransferStatusLit) == tuple(status.value for status in TransferStatus)
+    assert get_args(TransferTypeLit) == tuple(transfer_type.value for transfer_type in TransferType)
+    with pytest.raises(ValidationError):
+        TransferReportFilter.model_validate({"status": "archived"})
+
+
+def test_bulk_adapters_validate_the_whole_batch():
+    rows = [
+        {
+            "user_id": 1,
+            "notification_type": NotificationType.APPROVED,
+            "title": "Disetujui",
+            "message": "Mutasi disetujui",
+        },
+        {"user_id": 2, "notification_type": NotificationType.REJECTED, "title": "Ditolak", "message": "Berkas kurang"},
+    ]
+
+    notifications = NOTIFICATION_CREATE_LIST.validate_python(rows)
+
+    assert [type(notification) for notification in notifications] == [NotificationCreate, NotificationCreate]
+    with pytest.raises(ValidationError) as excinfo:
+        NOTIFICATION_CREATE_LIST.validate_python([rows[0], {**rows[1], "title": "x" * 201}])
+    assert [error["loc"] for error in excinfo.value.errors()] == [(1, "title")]
+
+
+def test_credentials_keep_whitespace():
+    login = UserLogin(username="siti", password=" rahasia 123 ")
+
+    assert login.password == " rahasia 123 "
+
+
+def test_created_at_range_indexes_are_brin(clean_db):
+    query = text("SELECT indexname, indexdef FROM pg_indexes WHERE indexname LIKE '%_created_brin' ORDER BY indexname")
+    with get_session() as session:
+        rows = session.connection().execute(query).all()
+
+    assert [name for name, _ in rows] == [
+        "ix_audit_created_brin",
+        "ix_notification_created_brin",
+        "ix_status_history_created_brin",
+        "ix_transfer_created_brin",
+    ]
+    assert all(
+        "USING brin (created_at)" in definition and "pages_per_range='32'" in definition for _, definition in rows
+    )
@@ -0,0 +1,59 @@
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models import AuditLog, DashboardStats, TransferStatus
+from app.responses import ORJSONResponse, dumps, orjson_response
+
+
+def test_dumps_handles_models_enums_and_decimals():
+    payload = {
+        "stats": DashboardStats(total_transfers=3),
+        "status": TransferStatus.APPROVED,
+        "amount": Decimal("1.50"),
+        "at": datetime(2024, 7, 1, 8, 30),
+    }
+
+    decoded = orjson.loads(dumps(payload))
+
+    assert decoded["stats"]["total_transfers"] == 3
+    assert decoded["status"] == "approved"
+    assert decoded["amount"] == "1.50"
+    assert decoded["at"] == "2024-07-01T08:30:00+00:00"
+
+
+def test_response_passes_pre_encoded_bytes_through():
+    body = dumps({"ok": True})
+
+    response = ORJSONResponse(body)
+
+    assert response.body == body
+    assert response.media_type == "application/json"
+
+
+def test_audit_values_are_stored_encoded_and_embedded_as_is():
+    audit = AuditLog(user_id=1, action="UPDATE", table_name="students", record_id=7)
+    audit.new_values_dict = {"full_name": "Andi Pratama"}
+
+    assert audit.new_values == b'{"full_name":"Andi Pratama"}'
+    assert audit.new_values_dict == {"full_name": "Andi Pratama"}
+    assert audit.old_values_dict is None
+    assert orjson.loads(dumps(audit))["new_values"] == {"full_name": "Andi Pratama"}
+
+
+def test_route_embeds_pre_encoded_audit_values():
+    api = FastAPI(default_response_class=ORJSONResponse)
+
+    @api.get("/audit")
+    def audit() -> ORJSONResponse:
+        log = AuditLog(user_id=1, action="UPDATE", table_name="students", record_id=7)
+        log.new_values_dict = {"k": 1}
+        return orjson_response(log)
+
+    response = TestClient(api).get("/audit")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["new_values"] == {"k": 1}
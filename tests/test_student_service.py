@@ -0,0 +1,58 @@
+import pytest
+from pydantic import ValidationError
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import Student
+from app.student_service import bulk_create_students
+
+
+def _row(nisn: str, full_name: str, **overrides) -> dict:
+    row = {
+        "nisn": nisn,
+        "full_name": full_name,
+        "birth_place": "Surabaya",
+        "birth_date": "2016-08-17T00:00:00",
+        "gender": "Perempuan",
+        "religion": "Islam",
+        "address": "Jl. Darmo 12",
+        "parent_name": "Hartono",
+        "current_grade": 2,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_bulk_create_students_inserts_all_rows(clean_db):
+    rows = [_row("1000000001", "Rina Hartono"), _row("1000000002", " Sari Hartono ", nis="S-02")]
+
+    with get_session() as session:
+        created = bulk_create_students(session, rows)
+        students = session.exec(select(Student).order_by(Student.nisn)).all()
+
+    assert created == 2
+    assert [s.full_name for s in students] == ["Rina Hartono", "Sari Hartono"]
+    assert students[1].nis == "S-02"
+    assert all(s.created_at is not None for s in students)
+
+
+def test_bulk_create_students_rejects_whole_batch_on_invalid_row(clean_db):
+    rows = [_row("1000000001", "Rina Hartono"), _row("1000000002", "Sari Hartono", birth_date="bukan tanggal")]
+
+    with get_session() as session:
+        with pytest.raises(ValidationError, match="1.birth_date"):
+            bulk_create_students(session, rows)
+        assert session.exec(select(Student)).all() == []
+
+
+def test_bulk_create_students_checks_gender_and_grade(clean_db):
+    rows = [_row("1000000001", "Rina Hartono", gender="P"), _row("1000000002", "Sari Hartono", current_grade=13)]
+
+    with get_session() as session:
+        with pytest.raises(ValidationError, match="(?s)0.gender.*1.current_grade"):
+            bulk_create_students(session, rows)
+
+
+def test_bulk_create_students_with_no_rows(clean_db):
+    with get_session() as session:
+        assert bulk_create_students(session, []) == 0
@@ -0,0 +1,296 @@
+from datetime import UTC, datetime
+
+import msgspec
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session
+
+from app.database import get_session
+from app.models import (
+    DocumentType,
+    StudentTransfer,
+    TransferCreate,
+    TransferDocument,
+    TransferReportFilter,
+    TransferStatus,
+    TransferStatusHistory,
+    TransferType,
+)
+from app.schemas_fast import StudentTransferRead, encode, rows_response
+from app.transfer_service import (
+    FAST_LIST_COLUMNS,
+    _pending_approvals_select,
+    create_transfer,
+    get_student_transfers,
+    get_transfer_detail,
+    get_transfer_report,
+    list_pending_approvals,
+    list_transfers,
+    list_transfers_fast,
+    list_transfers_with_documents,
+)
+
+
+def _get_transfer(session: Session, transfer_id: int) -> StudentTransfer:
+    transfer = session.get(StudentTransfer, transfer_id)
+    assert transfer is not None
+    return transfer
+
+
+def test_list_transfers_returns_newest_first(sample_transfers):
+    with get_session() as session:
+        transfers = list_transfers(session)
+
+    assert [t.id for t in transfers] == list(reversed(sample_transfers))
+    assert all(isinstance(t, StudentTransferRead) for t in transfers)
+    assert transfers[0].status == TransferStatus.SUBMITTED
+
+
+def test_list_transfers_paginates(sample_transfers):
+    with get_session() as session:
+        page = list_transfers(session, limit=1, offset=1)
+
+    assert [t.id for t in page] == [sample_transfers[1]]
+
+
+def test_list_transfers_encodes_to_json(sample_transfers):
+    with get_session() as session:
+        transfers = list_transfers(session, limit=1)
+
+    decoded = msgspec.json.decode(encode(transfers))
+
+    assert decoded[0]["transfer_number"] == "MUT-2024-003"
+    assert decoded[0]["transfer_type"] == "outgoing"
+    # the offset follows the connection's TimeZone; compare instants, not strings
+    assert datetime.fromisoformat(decoded[0]["transfer_date"]) == datetime(2024, 7, 3, tzinfo=UTC)
+
+
+def test_get_student_transfers_loads_detached_instances(sample_transfers):
+    with get_session() as session:
+        student_id = _get_transfer(session, sample_transfers[0]).student_id
+        transfers = get_student_transfers(session, student_id)
+
+    assert [t.id for t in transfers] == list(reversed(sample_transfers))
+    assert transfers[0].transfer_number == "MUT-2024-003"
+    state = inspect(transfers[0])
+    assert state is not None and state.detached
+
+
+def test_unchecked_instance_can_be_updated_without_reinsert(sample_transfers):
+    with get_session() as session:
+        student_id = _get_transfer(session, sample_transfers[0]).student_id
+        transfer = get_student_transfers(session, student_id)[0]
+    transfer_id = transfer.id
+
+    with get_session() as session:
+        session.add(transfer)
+        transfer.notes = "Berkas lengkap"
+        session.commit()
+
+    with get_session() as session:
+        assert transfer_id is not None
+        assert _get_transfer(session, transfer_id).notes == "Berkas lengkap"
+        assert len(get_student_transfers(session, student_id)) == 3
+
+
+def test_create_transfer_copies_display_fields(sample_transfers):
+    with get_session() as session:
+        transfer = _get_transfer(session, sample_transfers[0])
+
+    assert transfer.student_name == "Andi Pratama"
+    assert transfer.student_nisn == "0123456789"
+    assert transfer.origin_school_npsn == "20219001"
+    assert transfer.destination_school_name == "SD Negeri 2 Bandung"
+    assert transfer.created_by_name == "Siti Operator"
+    assert transfer.status == TransferStatus.SUBMITTED
+
+
+def test_create_transfer_rejects_unknown_student(sample_transfers):
+    data = TransferCreate(
+        student_id=9999,
+        transfer_type=TransferType.INCOMING,
+        origin_school_id=1,
+        destination_school_id=2,
+        transfer_reason="Pindah domisili",
+        grade_from=2,
+        grade_to=2,
+        semester="2",
+        academic_year="2024/2025",
+    )
+
+    with get_session() as session:
+        with pytest.raises(ValueError, match="Student 9999 not found"):
+            create_transfer(session, data, created_by_id=1)
+
+
+def test_renaming_source_rows_updates_transfers(sample_transfers):
+    with get_session() as session:
+        transfer = _get_transfer(session, sample_transfers[0])
+        transfer.student.full_name = "Andi Pratama Putra"
+        transfer.destination_school.name = "SD Negeri 2 Kota Bandung"
+        session.commit()
+
+    with get_session() as session:
+        transfers = list_transfers(session)
+
+    assert {t.student_name for t in transfers} == {"Andi Pratama Putra"}
+    assert {t.destination_school_name for t in transfers} == {"SD Negeri 2 Kota Bandung"}
+    assert {t.origin_school_name for t in transfers} == {"SD Negeri 1 Bandung"}
+
+
+def test_enum_columns_are_stored_as_small_ints(sample_transfers):
+    with get_session() as session:
+        _get_transfer(session, sample_transfers[0]).status = TransferStatus.APPROVED
+        session.commit()
+        raw = session.exec(text("SELECT id, status, transfer_type FROM student_transfers ORDER BY id")).all()  # type: ignore[call-overload]
+
+    assert [tuple(row) for row in raw] == [
+        (sample_transfers[0], 4, 1),
+        (sample_transfers[1], 1, 1),
+        (sample_transfers[2], 1, 1),
+    ]
+
+
+def test_transfer_report_filters_by_status_and_dates(sample_transfers):
+    with get_session() as session:
+        _get_transfer(session, sample_transfers[2]).status = TransferStatus.APPROVED
+        session.commit()
+
+        submitted = get_transfer_report(session, TransferReportFilter(status="submitted"))
+        approved = get_transfer_report(session, TransferReportFilter(status="approved"))
+        early = get_transfer_report(
+            session,
+            TransferReportFilter(
+                start_ts_ms=int(datetime(2024, 7, 1, tzinfo=UTC).timestamp() * 1000),
+                end_ts_ms=int(datetime(2024, 7, 2, tzinfo=UTC).timestamp() * 1000),
+            ),
+        )
+        outgoing = get_transfer_report(session, TransferReportFilter(transfer_type="outgoing"))
+        third_grade = get_transfer_report(session, TransferReportFilter(grade=3))
+        fourth_grade = get_transfer_report(session, TransferReportFilter(grade=4))
+        empty = get_transfer_report(session, TransferReportFilter(academic_year="2023/2024"))
+
+    assert [t.id for t in submitted] == [sample_transfers[1], sample_transfers[0]]
+    assert [t.id for t in approved] == [sample_transfers[2]]
+    assert approved[0].status == TransferStatus.APPROVED
+    assert [t.id for t in early] == [sample_transfers[1], sample_transfers[0]]
+    assert len(outgoing) == 3
+    assert len(third_grade) == 3 and third_grade[0].grade_from == 3
+    assert fourth_grade == []
+    assert empty == []
+
+
+def test_list_with_documents_loads_documents_and_blocks_lazy_loads(sample_transfers):
+    with get_session() as session:
+        session.add(
+            TransferDocument(
+                transfer_id=sample_transfers[2],
+                document_type=DocumentType.TRANSFER_LETTER,
+                file_name="surat_pindah.pdf",
+                file_path="uploads/surat_pindah.pdf",
+                file_size=1024,
+                mime_type="application/pdf",
+            )
+        )
+        session.commit()
+
+        transfers = list_transfers_with_documents(session)
+
+        assert [len(t.documents) for t in transfers] == [1, 0, 0]
+        assert transfers[0].destination_school_name == "SD Negeri 2 Bandung"
+        with pytest.raises(InvalidRequestError):
+            _ = transfers[0].origin_school
+
+
+def test_list_transfers_fast_returns_plain_tuples(sample_transfers):
+    with get_session() as session:
+        _get_transfer(session, sample_transfers[0]).status = TransferStatus.APPROVED
+        session.commit()
+
+        rows = list_transfers_fast(session, limit=2)
+        approved = list_transfers_fast(session, status=TransferStatus.APPROVED)
+
+    assert rows[0] == (
+        sample_transfers[2],
+        "MUT-2024-003",
+        TransferStatus.SUBMITTED,
+        datetime(2024, 7, 3, tzinfo=UTC),
+        "Andi Pratama",
+        "SD Negeri 1 Bandung",
+        "SD Negeri 2 Bandung",
+    )
+    assert len(rows) == 2
+    assert [row[0] for row in approved] == [sample_transfers[0]]
+
+
+def test_rows_response_encodes_columns_and_rows(sample_transfers):
+    with get_session() as session:
+        response = rows_response(FAST_LIST_COLUMNS, list_transfers_fast(session, limit=1))
+
+    decoded = msgspec.json.decode(response.body)
+
+    assert decoded["columns"] == list(FAST_LIST_COLUMNS)
+    assert decoded["rows"][0][1:3] == ["MUT-2024-003", "submitted"]
+    assert datetime.fromisoformat(decoded["rows"][0][3]) == datetime(2024, 7, 3, tzinfo=UTC)
+
+
+def test_list_pending_approvals_only_returns_open_transfers(sample_transfers):
+    with get_session() as session:
+        transfer = _get_transfer(session, sample_transfers[0])
+        transfer.status = TransferStatus.PENDING_APPROVAL
+        _get_transfer(session, sample_transfers[1]).status = TransferStatus.APPROVED
+        session.commit()
+        destination_id = transfer.destination_school_id
+        origin_id = transfer.origin_school_id
+
+        pending = list_pending_approvals(session, destination_id)
+        elsewhere = list_pending_approvals(session, origin_id)
+
+    assert [t.id for t in pending] == [sample_transfers[0], sample_transfers[2]]
+    assert elsewhere == []
+
+
+def test_pending_approvals_query_uses_the_partial_index(sample_transfers):
+    with get_session() as session:
+        transfer = _get_transfer(session, sample_transfers[0])
+        sql = str(
+            _pending_approvals_select(transfer.destination_school_id, 50).compile(
+                bind=session.get_bind(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        # a three-row table is always cheapest to scan; rule that out so the plan shows which index applies
+        connection = session.connection()
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in connection.execute(text(f"EXPLAIN {sql}")))
+
+    assert "ix_transfer_pending" in plan
+
+
+def test_get_transfer_detail_loads_children_up_front(sample_transfers):
+    with get_session() as session:
+        session.add(
+            TransferStatusHistory(
+                transfer_id=sample_transfers[0],
+                previous_status=TransferStatus.DRAFT,
+                new_status=TransferStatus.SUBMITTED,
+                changed_by_id=_get_transfer(session, sample_transfers[0]).created_by_id,
+            )
+        )
+        session.commit()
+
+    with get_session() as session:
+        transfer = get_transfer_detail(session, sample_transfers[0])
+        session.expunge_all()
+
+    assert transfer is not None
+    assert [h.new_status for h in transfer.status_history] == [TransferStatus.SUBMITTED]
+    assert transfer.documents == []
+    assert transfer.origin_school.npsn == "20219001"
+    assert transfer.destination_school.name == "SD Negeri 2 Bandung"
+    assert (transfer.student.full_name, transfer.student.current_grade) == ("Andi Pratama", 3)
+
+
+def test_get_transfer_detail_missing(clean_db):
+    with get_session() as session:
+        assert get_transfer_detail(session, 9999) is None